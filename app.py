@@ -10,24 +10,27 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Now try your import
-from styles.main import get_custom_css
+from styles.main import get_css_link
 
+import pandas as pd
 import streamlit as st
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
 
 # Import our modular components
-from utils.config import COLORS, ICONS
+from utils.config import COLORS, ICONS, STATUS_COLOR_MAP
 
 from utils.helpers import (
     load_data, save_data, get_task_stats, get_financial_summary,
-    is_task_overdue, get_days_remaining, optimize_performance
+    is_task_overdue, get_sidebar_summary, optimize_performance,
+    tasks_by_week
 )
 from components.ui import render_progress_ring, render_status_indicator, render_card, render_metric
 from components.tasks import render_task_card, render_task_filters, filter_tasks, render_smart_suggestions
-from components.finances import (
-    render_payment_card, editable_metric, render_financial_overview, render_budget_breakdown
-)
-from components.notifications import show_toast, render_toast, generate_notifications, render_notification_center
+# components.finances (and its plotly usage) is imported lazily inside
+# render_finances_page so dashboard-only visits skip the cost
+from components.notifications import show_toast, render_toast
 
 # ============================================================================
 # APP CONFIGURATION
@@ -50,8 +53,23 @@ if 'toast_type' not in st.session_state:
 if 'task_filter' not in st.session_state:
     st.session_state.task_filter = 'all'
 
-# Load CSS
-st.markdown(get_custom_css(), unsafe_allow_html=True)
+# Navigation labels built once at import; the routing table at the bottom
+# maps each label to its renderer
+PAGE_LABELS = (
+    f"{ICONS['dashboard']} Dashboard",
+    f"{ICONS['tasks']} Tasks",
+    f"{ICONS['finances']} Finances",
+    f"{ICONS['timeline']} Timeline",
+    f"{ICONS['contacts']} Contacts",
+    f"{ICONS['communications']} Communications",
+    f"{ICONS['studio']} Studio",
+    f"{ICONS['settings']} Settings",
+)
+
+# Load CSS as a browser-cacheable static file. Emitted via st.markdown:
+# st.html sanitizes with DOMPurify's HTML profile, which strips <link>
+# tags entirely (unsafe_allow_html markdown is not sanitized)
+st.markdown(get_css_link(), unsafe_allow_html=True)
 
 # Load data
 data = load_data()
@@ -67,20 +85,20 @@ with st.sidebar:
 
     page = st.radio(
         "Navigate",
-        [f"{ICONS['dashboard']} Dashboard", f"{ICONS['tasks']} Tasks", f"{ICONS['finances']} Finances", f"{ICONS['timeline']} Timeline", f"{ICONS['contacts']} Contacts", f"{ICONS['communications']} Communications", f"{ICONS['studio']} Studio", f"{ICONS['settings']} Settings"],
+        PAGE_LABELS,
         label_visibility="collapsed"
     )
 
     st.markdown("---")
     st.markdown("### 📊 Quick Stats")
 
-    stats = get_task_stats(data["tasks"])
-    progress = (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
+    summary = get_sidebar_summary(data)
+    stats = summary["stats"]
 
-    st.progress(progress / 100)
+    st.progress(summary["progress"] / 100)
     st.caption(f"{stats['completed']}/{stats['total']} tasks complete")
 
-    days_left = get_days_remaining(data["project"])
+    days_left = summary["days_left"]
     if days_left > 0:
         st.metric("Days to Launch", days_left)
     else:
@@ -90,34 +108,44 @@ with st.sidebar:
 # PAGE RENDERERS
 # ============================================================================
 
-def render_dashboard_page():
-    """Render the main dashboard page."""
-    # Load data at the start of the function
-    data = load_data()
-    stats = get_task_stats(data['tasks'])
-    progress = int((stats['completed'] / stats['total']) * 100) if stats['total'] > 0 else 0
-
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.markdown(f"# {ICONS['dashboard']} Project Dashboard")
-        st.markdown(f"**{data['project']['name']}** | Week {data['project']['current_week']} of 6")
-    with col2:
-        if st.button(f"{ICONS['refresh']} Refresh"):
-            data = load_data()
-            stats = get_task_stats(data['tasks'])
-            progress = int((stats['completed'] / stats['total']) * 100) if stats['total'] > 0 else 0
-            st.rerun()
+@st.fragment
+def render_week_priorities(week_tasks):
+    """Render the weekly priority list as a fragment so interactions here
+    don't rerun the whole page."""
+    if week_tasks:
+        # One linear pass instead of three comprehensions with list-membership scans
+        critical, overdue, others = [], [], []
+        for task in week_tasks:
+            if task["priority"] == "critical":
+                critical.append(task)
+            elif is_task_overdue(task):
+                overdue.append(task)
+            else:
+                others.append(task)
 
-    st.markdown("---")
+        # Batch all cards into one delta; st.html avoids running the
+        # markdown pipeline over what is already plain HTML
+        st.html("".join(render_task_card(task) for task in chain(critical, overdue, others)))
+    else:
+        st.info("No tasks scheduled for this week yet.")
 
-    # Enhanced Key Metrics with Progress Rings
-    finances = optimize_performance()
+# Row template for the Project Status card, parsed once at import
+_STATUS_ROW_TMPL = (
+    '<div style="display: flex; align-items: center; margin: 6px 0;">'
+    '{indicator}<span style="color: {color}; font-size: 14px;">{label}</span></div>'
+)
 
-    # Progress Overview with Rings in organized cards
-    st.markdown('<div class="stats-grid">', unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def _build_dashboard_cards(progress: int, completed: int, total: int, profit: int,
+                           budget_used: float, profit_margin: float,
+                           project_status: str, current_week: int) -> str:
+    """Assemble the three dashboard stat cards as one HTML string.
 
+    Pure function of the displayed scalars, so the f-string work is
+    memoized and unrelated widget reruns emit the cached string.
+    """
     # Project Progress Card
-    st.markdown(f'''
+    progress_card = f'''
     <div style="background-color: #1f1f1f; border: 1px solid #d4af37; border-radius: 16px; padding: 20px; margin: 8px 0;">
         <div style="font-size: 18px; color: #d4af37; margin-bottom: 8px;">📊 Project Progress</div>
         <div style="text-align: center; margin-bottom: 12px;">
@@ -125,16 +153,13 @@ def render_dashboard_page():
                 {int(progress)}%
             </div>
         </div>
-        <div style="font-size: 24px; font-weight: 700; color: #d4af37; margin-bottom: 4px;">{stats['completed']}/{stats['total']}</div>
+        <div style="font-size: 24px; font-weight: 700; color: #d4af37; margin-bottom: 4px;">{completed}/{total}</div>
         <div style="font-size: 12px; color: #a0a0a0; font-weight: 500; text-transform: uppercase; letter-spacing: 0.5px;">Tasks Completed</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
     # Financial Health Card
-    budget_used = ((finances['received'] + finances['paid_out']) / data['finances']['budget_total']) * 100
-    profit_margin = (finances['profit'] / data['finances']['budget_total']) * 100 if data['finances']['budget_total'] > 0 else 0
-
-    st.markdown(f'''
+    financial_card = f'''
     <div style="background-color: #1f1f1f; border: 1px solid #d4af37; border-radius: 16px; padding: 20px; margin: 8px 0;">
         <div style="font-size: 18px; color: #d4af37; margin-bottom: 8px;">💰 Financial Health</div>
         <div style="display: flex; justify-content: space-around; align-items: center; margin-bottom: 12px;">
@@ -151,44 +176,74 @@ def render_dashboard_page():
                 <div style="font-size: 12px; color: #a0a0a0; margin-top: 4px;">Profit</div>
             </div>
         </div>
-        <div style="font-size: 24px; font-weight: 700; color: #d4af37; margin-bottom: 4px;">R{finances['profit']:,}</div>
+        <div style="font-size: 24px; font-weight: 700; color: #d4af37; margin-bottom: 4px;">R{profit:,}</div>
         <div style="font-size: 12px; color: #a0a0a0; font-weight: 500; text-transform: uppercase; letter-spacing: 0.5px;">Total Profit</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
     # Status Overview Card
     status_items = [
-        ("Project", "active" if data["project"]["status"] == "In Progress" else "completed"),
-        ("Week", "active" if data["project"]["current_week"] <= 3 else "completed"),
+        ("Project", "active" if project_status == "In Progress" else "completed"),
+        ("Week", "active" if current_week <= 3 else "completed"),
         ("Budget", "completed" if budget_used < 90 else "warning" if budget_used < 100 else "overdue"),
         ("Tasks", "completed" if progress > 80 else "pending")
     ]
 
-    status_html = ""
-    for label, status in status_items:
-        indicator = render_status_indicator(status, 8)
-        status_color = {
-            'completed': COLORS['success'],
-            'pending': COLORS['warning'],
-            'overdue': COLORS['danger'],
-            'active': COLORS['info']
-        }.get(status, COLORS['text_muted'])
-        status_html += f'<div style="display: flex; align-items: center; margin: 6px 0;">{indicator}<span style="color: {status_color}; font-size: 14px;">{label}</span></div>'
-
-    st.markdown(f'''
+    status_html = "".join(
+        _STATUS_ROW_TMPL.format(
+            indicator=render_status_indicator(status, 8),
+            color=STATUS_COLOR_MAP.get(status, COLORS['text_muted']),
+            label=label,
+        )
+        for label, status in status_items
+    )
+
+    status_card = f'''
     <div class="stat-card fade-in">
         <div style="font-size: 18px; color: {COLORS['gold']}; margin-bottom: 16px;">🎯 Project Status</div>
         <div style="display: flex; flex-direction: column; gap: 8px;">
             {status_html}
         </div>
         <div style="margin-top: 16px; padding-top: 16px; border-top: 1px solid rgba(212, 175, 55, 0.2);">
-            <div class="stat-value">{data["project"]["current_week"]}</div>
+            <div class="stat-value">{current_week}</div>
             <div class="stat-label">Current Week</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
-    st.markdown('</div>', unsafe_allow_html=True)  # Close stats-grid
+    return f'<div class="stats-grid">{progress_card}{financial_card}{status_card}</div>'
+
+def render_dashboard_page():
+    """Render the main dashboard page."""
+    stats = get_task_stats(data['tasks'])
+    progress = int((stats['completed'] / stats['total']) * 100) if stats['total'] > 0 else 0
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.markdown(f"# {ICONS['dashboard']} Project Dashboard")
+        st.markdown(f"**{data['project']['name']}** | Week {data['project']['current_week']} of 6")
+    with col2:
+        if st.button(f"{ICONS['refresh']} Refresh"):
+            st.rerun()
+
+    st.markdown("---")
+
+    # Enhanced Key Metrics with Progress Rings
+    finances = optimize_performance()
+
+    # One shared budget scale factor instead of repeated divisions below
+    budget_total = data['finances']['budget_total']
+    pct_of_budget = 100.0 / budget_total if budget_total else 0.0
+    budget_used = (finances['received'] + finances['paid_out']) * pct_of_budget
+    profit_margin = finances['profit'] * pct_of_budget
+
+    # The three stat cards are cached on the scalars they display and
+    # emitted as a single delta
+    st.html(_build_dashboard_cards(
+        progress, stats['completed'], stats['total'], finances['profit'],
+        budget_used, profit_margin,
+        data["project"]["status"], data["project"]["current_week"],
+    ))
 
     st.markdown("---")
 
@@ -197,12 +252,12 @@ def render_dashboard_page():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("💰 Total Budget", f"R{data['finances']['budget_total']:,}")
+        st.metric("💰 Total Budget", f"R{budget_total:,}")
     with col2:
-        received_pct = (finances['received'] / data['finances']['budget_total']) * 100
+        received_pct = finances['received'] * pct_of_budget
         st.metric("📥 Money In", f"R{finances['received']:,}", f"{received_pct:.1f}% of budget")
     with col3:
-        paid_pct = (finances['paid_out'] / data['finances']['budget_total']) * 100
+        paid_pct = finances['paid_out'] * pct_of_budget
         st.metric("📤 Money Out", f"R{finances['paid_out']:,}", f"{paid_pct:.1f}% spent")
     with col4:
         profit_color = "🟢" if finances['profit'] > 0 else "🔴"
@@ -213,17 +268,8 @@ def render_dashboard_page():
     # This week priorities
     st.markdown("### 🎯 This Week's Priorities")
     current_week = data["project"]["current_week"]
-    week_tasks = [t for t in data["tasks"] if t["week"] == current_week]
-
-    if week_tasks:
-        critical = [t for t in week_tasks if t["priority"] == "critical"]
-        overdue = [t for t in week_tasks if is_task_overdue(t) and t not in critical]
-        others = [t for t in week_tasks if t not in critical and t not in overdue]
-
-        for task in critical + overdue + others:
-            render_task_card(task)
-    else:
-        st.info("No tasks scheduled for this week yet.")
+    week_tasks = tasks_by_week(data["tasks"]).get(current_week, [])
+    render_week_priorities(week_tasks)
 
     # Strategic Actions
     st.markdown("---")
@@ -246,16 +292,22 @@ def render_dashboard_page():
     # Generated message display
     if st.session_state.get("action") == "daughters_update":
         with st.expander("📱 Copy & Send to Daughters", expanded=True):
-            completed = [t["task"] for t in week_tasks if t["status"] == "completed"]
-            pending_critical = [t["task"] for t in week_tasks if t["status"] != "completed" and t["priority"] == "critical"]
+            # islice stops scanning once 3 matches are found
+            completed = list(islice(
+                (t["task"] for t in week_tasks if t["status"] == "completed"), 3))
+            pending_critical = list(islice(
+                (t["task"] for t in week_tasks if t["status"] != "completed" and t["priority"] == "critical"), 3))
+
+            completed_block = "\n".join("- " + t for t in completed) if completed else "- Building momentum on key tasks"
+            next_steps_block = "\n".join("- " + t for t in pending_critical) if pending_critical else "- All on track!"
 
             message = f"""Week {current_week} update ✓
 
 ✅ Completed:
-{chr(10).join(['- ' + t for t in completed[:3]]) if completed else '- Building momentum on key tasks'}
+{completed_block}
 
 🎯 Next Steps:
-{chr(10).join(['- ' + t for t in pending_critical[:3]]) if pending_critical else '- All on track!'}
+{next_steps_block}
 
 Timeline is locked in. Your dad's going to love this 👍"""
 
@@ -264,16 +316,15 @@ Timeline is locked in. Your dad's going to love this 👍"""
                 st.session_state.action = None
                 st.rerun()
 
-def render_tasks_page():
-    """Render the tasks management page."""
-    st.markdown(f"# {ICONS['tasks']} Task Management")
-    st.markdown("---")
-
+@st.fragment
+def render_task_list(tasks):
+    """Render filters plus the filtered task list as a fragment; checkbox
+    and filter interactions rerun only this block, not the full app."""
     # Task filters
     st.session_state.task_filter = render_task_filters(st.session_state.task_filter)
 
     # Filter tasks
-    filtered_tasks = filter_tasks(data["tasks"], st.session_state.task_filter)
+    filtered_tasks = filter_tasks(tasks, st.session_state.task_filter)
 
     # Task statistics
     total_tasks = len(filtered_tasks)
@@ -290,35 +341,65 @@ def render_tasks_page():
 
     st.markdown("---")
 
-    # Render filtered tasks
+    # Render filtered tasks as one editable table: a single widget
+    # registration instead of 4 columns + a checkbox per row
     if filtered_tasks:
-        for task in filtered_tasks:
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-
-            with col1:
-                render_task_card(task)
-
-            with col2:
-                is_complete = task["status"] == "completed"
-                if st.checkbox("", value=is_complete, key=f"task_{task['id']}"):
-                    if task["status"] != "completed":
-                        task["status"] = "completed"
-                        show_toast(f"✅ Task completed: {task['task'][:30]}...", "success")
-                else:
-                    if task["status"] != "pending":
-                        task["status"] = "pending"
-                        show_toast(f"🔄 Task reopened: {task['task'][:30]}...", "info")
-
-            with col3:
-                # Move up/down buttons would go here
-                pass
-
-            with col4:
-                # Delete button would go here
-                pass
+        df = pd.DataFrame([
+            {
+                "Done": t["status"] == "completed",
+                "Task": t["task"],
+                "Priority": t["priority"],
+                "Deadline": t["deadline"],
+                "Assignee": t["assignee"],
+                "Week": t["week"],
+            }
+            for t in filtered_tasks
+        ])
+
+        edited = st.data_editor(
+            df,
+            column_config={
+                "Done": st.column_config.CheckboxColumn("Done", help="Mark task as completed"),
+            },
+            disabled=["Task", "Priority", "Deadline", "Assignee", "Week"],
+            hide_index=True,
+            use_container_width=True,
+            key="task_editor",
+        )
+
+        # Write status changes back onto the task dicts (same objects as
+        # data['tasks'], so the save below picks them up)
+        dirty = False
+        for row_idx, task in enumerate(filtered_tasks):
+            done = bool(edited.iloc[row_idx]["Done"])
+            if done and task["status"] != "completed":
+                task["status"] = "completed"
+                dirty = True
+                show_toast(f"✅ Task completed: {task['task'][:30]}...", "success")
+            elif not done and task["status"] == "completed":
+                task["status"] = "pending"
+                dirty = True
+                show_toast(f"🔄 Task reopened: {task['task'][:30]}...", "info")
+
+        # Serialize only when something actually changed; unchanged reruns
+        # skip the disk write entirely. A real change escalates to an
+        # app-scoped rerun so the toast and sidebar stats render now
+        # rather than on the next full rerun
+        if dirty:
+            save_data(data)
+            st.rerun(scope="app")
     else:
         st.info("No tasks match the current filter.")
 
+def render_tasks_page():
+    """Render the tasks management page."""
+    st.markdown(f"# {ICONS['tasks']} Task Management")
+    st.markdown("---")
+
+    from components.notifications import generate_notifications, render_notification_center
+
+    render_task_list(data["tasks"])
+
     # Advanced Notifications
     notifications = generate_notifications(data)
     if notifications:
@@ -367,8 +448,14 @@ def render_tasks_page():
 
         if st.button("Add Task", type="primary"):
             if task_input.strip():
+                # Persisted monotonic counter (seeded in load_data); the
+                # streaming max only runs for data files predating it
+                next_id = data.get(
+                    "_next_id",
+                    max((t["id"] for t in data["tasks"]), default=0) + 1
+                )
                 new_task = {
-                    "id": max([t["id"] for t in data["tasks"]] + [0]) + 1,
+                    "id": next_id,
                     "task": task_input.strip(),
                     "week": new_week,
                     "deadline": new_deadline.strftime("%Y-%m-%d"),
@@ -377,6 +464,7 @@ def render_tasks_page():
                     "priority": new_priority
                 }
                 data["tasks"].append(new_task)
+                data["_next_id"] = next_id + 1
                 save_data(data)
                 show_toast("✅ Task added successfully!", "success")
                 st.rerun()
@@ -385,33 +473,42 @@ def render_tasks_page():
 
 def render_finances_page():
     """Render the financial overview page."""
+    from components.finances import (
+        render_payment_card, editable_metric, render_financial_overview, render_budget_breakdown
+    )
+
     st.markdown(f"# {ICONS['finances']} Financial Overview")
     st.markdown("---")
 
     finances = get_financial_summary(data["finances"])
 
     # Financial overview
-    render_financial_overview(data["finances"])
+    render_financial_overview(data)
 
     # Editable budget components
     st.markdown("## 📊 Budget Allocation")
     col1, col2 = st.columns(2)
 
+    # Persistence runs inside the metric fragment's save path; only a
+    # save triggers an app-scoped rerun, while open/cancel clicks stay
+    # scoped to the fragment
+    def _save_designer(value):
+        data['finances']['designer_total'] = value
+        save_data(data)
+        show_toast("✅ Designer budget updated!", "success")
+
+    def _save_expenses(value):
+        data['finances']['expenses_misc'] = value
+        save_data(data)
+        show_toast("✅ Expenses updated!", "success")
+
     with col1:
-        new_designer = editable_metric("Designer Total", data['finances']['designer_total'], "designer_total", "R")
-        if new_designer is not None:
-            data['finances']['designer_total'] = new_designer
-            save_data(data)
-            show_toast("✅ Designer budget updated!", "success")
-            st.rerun()
+        editable_metric("Designer Total", data['finances']['designer_total'], "designer_total", "R",
+                        on_save=_save_designer)
 
     with col2:
-        new_expenses = editable_metric("Misc Expenses", data['finances']['expenses_misc'], "expenses_misc", "R")
-        if new_expenses is not None:
-            data['finances']['expenses_misc'] = new_expenses
-            save_data(data)
-            show_toast("✅ Expenses updated!", "success")
-            st.rerun()
+        editable_metric("Misc Expenses", data['finances']['expenses_misc'], "expenses_misc", "R",
+                        on_save=_save_expenses)
 
     # Cash flow visualization
     st.markdown("---")
@@ -419,19 +516,15 @@ def render_finances_page():
 
     with col1:
         st.markdown("### 📥 Money In")
-        for payment in data["finances"]["received"]:
-            render_payment_card(payment, "in")
+        st.html("".join(render_payment_card(p, "in") for p in data["finances"]["received"]))
         st.markdown("**Pending Income:**")
-        for payment in data["finances"]["pending_in"]:
-            render_payment_card(payment, "in")
+        st.html("".join(render_payment_card(p, "in") for p in data["finances"]["pending_in"]))
 
     with col2:
         st.markdown("### 📤 Money Out")
-        for payment in data["finances"]["paid_out"]:
-            render_payment_card(payment, "out")
+        st.html("".join(render_payment_card(p, "out") for p in data["finances"]["paid_out"]))
         st.markdown("**Pending Payments:**")
-        for payment in data["finances"]["pending_out"]:
-            render_payment_card(payment, "out")
+        st.html("".join(render_payment_card(p, "out") for p in data["finances"]["pending_out"]))
 
     st.markdown("---")
 
@@ -442,28 +535,26 @@ def render_finances_page():
 # MAIN APP LOGIC
 # ============================================================================
 
+def _render_coming_soon(heading: str, name: str) -> None:
+    """Placeholder renderer for pages that aren't built yet."""
+    st.markdown(f"# {heading}")
+    st.markdown(f"{name} page - Coming soon!")
+
+# Label → renderer table; one dict lookup per rerun instead of an
+# if/elif ladder rebuilding the label f-strings
+PAGE_ROUTES = {
+    PAGE_LABELS[0]: render_dashboard_page,
+    PAGE_LABELS[1]: render_tasks_page,
+    PAGE_LABELS[2]: render_finances_page,
+    PAGE_LABELS[3]: partial(_render_coming_soon, f"{ICONS['timeline']} 6-Week Project Timeline", "Timeline"),
+    PAGE_LABELS[4]: partial(_render_coming_soon, f"{ICONS['contacts']} Contact Management", "Contacts"),
+    PAGE_LABELS[5]: partial(_render_coming_soon, f"{ICONS['communications']} Communication Templates", "Communications"),
+    PAGE_LABELS[6]: partial(_render_coming_soon, f"{ICONS['studio']} Design Studio", "Studio"),
+    PAGE_LABELS[7]: partial(_render_coming_soon, f"{ICONS['settings']} Settings", "Settings"),
+}
+
 # Page routing
-if page == f"{ICONS['dashboard']} Dashboard":
-    render_dashboard_page()
-elif page == f"{ICONS['tasks']} Tasks":
-    render_tasks_page()
-elif page == f"{ICONS['finances']} Finances":
-    render_finances_page()
-elif page == f"{ICONS['timeline']} Timeline":
-    st.markdown(f"# {ICONS['timeline']} 6-Week Project Timeline")
-    st.markdown("Timeline page - Coming soon!")
-elif page == f"{ICONS['contacts']} Contacts":
-    st.markdown(f"# {ICONS['contacts']} Contact Management")
-    st.markdown("Contacts page - Coming soon!")
-elif page == f"{ICONS['communications']} Communications":
-    st.markdown(f"# {ICONS['communications']} Communication Templates")
-    st.markdown("Communications page - Coming soon!")
-elif page == f"{ICONS['studio']} Studio":
-    st.markdown(f"# {ICONS['studio']} Design Studio")
-    st.markdown("Studio page - Coming soon!")
-elif page == f"{ICONS['settings']} Settings":
-    st.markdown(f"# {ICONS['settings']} Settings")
-    st.markdown("Settings page - Coming soon!")
+PAGE_ROUTES.get(page, render_dashboard_page)()
 
 # Render toast notifications
 render_toast()
@@ -6,16 +6,33 @@ Specialized components for financial data visualization and editing.
 from typing import Dict, Any, List
 import streamlit as st
 from utils.config import COLORS
-from utils.helpers import html_escape, format_currency, get_financial_summary
+from utils.helpers import html_escape, format_currency, get_financial_summary, save_data
+from components.notifications import show_toast
 from components.ui import render_progress_ring, render_card
 
-def render_payment_card(payment: Dict[str, Any], direction: str = "in") -> None:
+# Payment card template, precompiled at import with the muted text color
+# baked in; render_payment_card substitutes only the variable fields
+_PAYMENT_CARD_TPL = (
+    '<div class="task-card {card_class}" style="border-left: 4px solid {color};">'
+    '<strong style="color: {color}; font-size: 16px;">{status_icon} {amount}</strong>'
+    f'<br><small style="color: {COLORS["text_dark"]}; font-size: 13px;">'
+    '{label} | {date_label}: {date}</small>'
+    '</div>'
+)
+
+def render_payment_card(payment: Dict[str, Any], direction: str = "in") -> str:
     """
-    Render payment card (money in/out).
+    Build a payment card (money in/out).
+
+    Returns HTML so callers can batch a whole column of cards into a
+    single st.markdown call.
 
     Args:
         payment: Payment data dictionary
         direction: "in" for money received, "out" for money paid
+
+    Returns:
+        HTML string for the payment card
     """
     status = payment["status"]
     is_pending = status == "pending"
@@ -27,19 +44,26 @@ def render_payment_card(payment: Dict[str, Any], direction: str = "in") -> None:
 
     card_class = "task-complete" if not is_pending else "task-pending"
 
-    st.markdown(f"""
-    <div class="task-card {card_class}" style="border-left: 4px solid {color};">
-        <strong style="color: {color}; font-size: 16px;">{status_icon} {format_currency(payment['amount'])}</strong>
-        <br><small style="color: {COLORS['text_dark']}; font-size: 13px;">
-            {label_safe} | {date_label}: {html_escape(payment['date'])}
-        </small>
-    </div>
-    """, unsafe_allow_html=True)
+    return _PAYMENT_CARD_TPL.format(
+        card_class=card_class,
+        color=color,
+        status_icon=status_icon,
+        amount=format_currency(payment['amount']),
+        label=label_safe,
+        date_label=date_label,
+        date=html_escape(payment['date']),
+    )
 
-def editable_metric(label: str, value: float, key: str, prefix: str = "R", suffix: str = "", help_text: str = "") -> float:
+def editable_metric(label: str, value: float, key: str, prefix: str = "R", suffix: str = "",
+                    help_text: str = "", on_save=None) -> None:
     """
     Create an editable metric with click-to-edit functionality.
 
+    The whole widget runs inside an st.fragment, so entering edit mode
+    and cancelling rerun only these few lines instead of the entire app.
+    Saving invokes on_save(new_value) to persist, then triggers one
+    app-scoped rerun so the rest of the page picks up the change.
+
     Args:
         label: Display label for the metric
         value: Current value
@@ -47,9 +71,7 @@ def editable_metric(label: str, value: float, key: str, prefix: str = "R", suffi
         prefix: Prefix for display (e.g., "R")
         suffix: Suffix for display
         help_text: Help text for the metric
-
-    Returns:
-        New value if edited, None otherwise
+        on_save: Callback receiving the new value when saved
     """
     edit_key = f"edit_{key}"
 
@@ -57,137 +79,136 @@ def editable_metric(label: str, value: float, key: str, prefix: str = "R", suffi
     if edit_key not in st.session_state:
         st.session_state[edit_key] = False
 
-    # Display current value as a button to enable editing
-    if st.button(f"{prefix}{value:,.0f}{suffix}",
-                key=f"display_{key}",
-                help=help_text or f"Click to edit {label.lower()}",
-                use_container_width=True):
-        st.session_state[edit_key] = True
-        st.rerun()
-
-    # Show current value as metric when not editing
-    if not st.session_state[edit_key]:
-        st.metric(label, f"{prefix}{value:,.0f}{suffix}")
-
-    # Show edit form when in edit mode
-    if st.session_state[edit_key]:
-        with st.container():
-            st.markdown(f"### ✏️ Edit {label}")
-
-            with st.form(key=f"form_{key}"):
-                col_a, col_b, col_c = st.columns([2, 1, 1])
-
-                with col_a:
-                    new_value = st.number_input(
-                        f"New {label}",
-                        value=float(value),
-                        min_value=0.0,
-                        max_value=10000000.0,  # Max 10M to prevent unreasonable values
-                        step=1000.0,
-                        format="%.0f",
-                        help=f"Enter new value for {label.lower()}"
-                    )
-
-                with col_b:
-                    save_clicked = st.form_submit_button("💾 Save", use_container_width=True)
-
-                with col_c:
-                    cancel_clicked = st.form_submit_button("❌ Cancel", use_container_width=True)
-
-            if save_clicked:
-                st.session_state[edit_key] = False
-                st.success(f"✅ {label} updated successfully!")
-                return new_value
-
-            if cancel_clicked:
-                st.session_state[edit_key] = False
-                st.info("Changes cancelled")
-                st.rerun()
-
-    return None
-
-def render_financial_overview(finances: Dict[str, Any]) -> None:
+    @st.fragment
+    def _metric() -> None:
+        # Display current value as a button to enable editing; the click
+        # reruns just this fragment, and the form shows in the same pass
+        if st.button(f"{prefix}{value:,.0f}{suffix}",
+                    key=f"display_{key}",
+                    help=help_text or f"Click to edit {label.lower()}",
+                    use_container_width=True):
+            st.session_state[edit_key] = True
+
+        # Show current value as metric when not editing
+        if not st.session_state[edit_key]:
+            st.metric(label, f"{prefix}{value:,.0f}{suffix}")
+            return
+
+        # Show edit form when in edit mode
+        st.markdown(f"### ✏️ Edit {label}")
+
+        with st.form(key=f"form_{key}"):
+            col_a, col_b, col_c = st.columns([2, 1, 1])
+
+            with col_a:
+                new_value = st.number_input(
+                    f"New {label}",
+                    value=float(value),
+                    min_value=0.0,
+                    max_value=10000000.0,  # Max 10M to prevent unreasonable values
+                    step=1000.0,
+                    format="%.0f",
+                    help=f"Enter new value for {label.lower()}"
+                )
+
+            with col_b:
+                save_clicked = st.form_submit_button("💾 Save", use_container_width=True)
+
+            with col_c:
+                cancel_clicked = st.form_submit_button("❌ Cancel", use_container_width=True)
+
+        if save_clicked:
+            st.session_state[edit_key] = False
+            if on_save is not None:
+                on_save(new_value)
+                # Only a save escapes the fragment: the new value has to
+                # reach the summary cards rendered elsewhere on the page
+                st.rerun(scope="app")
+            st.success(f"✅ {label} updated successfully!")
+            st.rerun(scope="fragment")
+
+        if cancel_clicked:
+            st.session_state[edit_key] = False
+            st.info("Changes cancelled")
+            st.rerun(scope="fragment")
+
+    _metric()
+
+def render_financial_overview(data: Dict[str, Any]) -> None:
     """
     Render the financial overview section with cards.
 
     Args:
-        finances: Financial data dictionary
+        data: Project data dictionary (the budget edit saves through it)
     """
+    finances = data["finances"]
     summary = get_financial_summary(finances)
 
     # Financial Summary Cards
     st.markdown("## 💰 Financial Summary")
 
-    # Editable budget metrics in organized cards
-    st.markdown('<div class="financial-grid">', unsafe_allow_html=True)
-
-    # Budget Total Card
+    # Editable budget metric stays a real widget; the display cards below
+    # are assembled as strings and emitted in a single st.html call
     budget_total = finances.get('budget_total', 50000)
-    new_budget = editable_metric("Total Budget", budget_total, "budget_total", "R")
-    if new_budget is not None:
+
+    def _save_budget(new_budget: float) -> None:
         finances['budget_total'] = new_budget
+        save_data(data)
+        show_toast("✅ Total budget updated!", "success")
+
+    editable_metric("Total Budget", budget_total, "budget_total", "R", on_save=_save_budget)
 
-    st.markdown(f'''
+    budget_card = f'''
     <div class="financial-card">
         <div style="font-size: 24px; color: {COLORS['gold']}; margin-bottom: 8px;">💼</div>
         <div style="font-size: 28px; font-weight: 700; color: {COLORS['gold']}; margin-bottom: 4px;">{format_currency(budget_total)}</div>
         <div style="font-size: 14px; color: {COLORS['text_muted']}; font-weight: 500;">TOTAL BUDGET</div>
         <div style="font-size: 12px; color: rgba(255,255,255,0.6); margin-top: 8px;">Click to edit</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
-    # Income Card
-    st.markdown(f'''
+    income_card = f'''
     <div class="financial-card income">
         <div style="font-size: 24px; color: {COLORS['success']}; margin-bottom: 8px;">📈</div>
         <div style="font-size: 28px; font-weight: 700; color: {COLORS['success']}; margin-bottom: 4px;">{format_currency(summary['received'])}</div>
         <div style="font-size: 14px; color: {COLORS['text_muted']}; font-weight: 500;">TOTAL RECEIVED</div>
         <div style="font-size: 12px; color: rgba(255,255,255,0.6); margin-top: 8px;">+{format_currency(summary['pending_in'])} pending</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
-    # Expenses Card
-    st.markdown(f'''
+    expense_card = f'''
     <div class="financial-card expense">
         <div style="font-size: 24px; color: {COLORS['danger']}; margin-bottom: 8px;">📉</div>
         <div style="font-size: 28px; font-weight: 700; color: {COLORS['danger']}; margin-bottom: 4px;">{format_currency(summary['paid_out'])}</div>
         <div style="font-size: 14px; color: {COLORS['text_muted']}; font-weight: 500;">TOTAL PAID</div>
         <div style="font-size: 12px; color: rgba(255,255,255,0.6); margin-top: 8px;">+{format_currency(summary['pending_out'])} pending</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
-    # Profit Card
     profit_color = COLORS['success'] if summary['profit'] > 0 else COLORS['danger']
-    st.markdown(f'''
+    profit_card = f'''
     <div class="financial-card">
         <div style="font-size: 24px; color: {profit_color}; margin-bottom: 8px;">💰</div>
         <div style="font-size: 28px; font-weight: 700; color: {profit_color}; margin-bottom: 4px;">{format_currency(summary['profit'])}</div>
         <div style="font-size: 14px; color: {COLORS['text_muted']}; font-weight: 500;">PROJECT PROFIT</div>
         <div style="font-size: 12px; color: rgba(255,255,255,0.6); margin-top: 8px;">Balance: {format_currency(summary['balance'])}</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
-    st.markdown('</div>', unsafe_allow_html=True)  # Close financial-grid
+    st.html(f'<div class="financial-grid">{budget_card}{income_card}{expense_card}{profit_card}</div>')
 
-def render_budget_breakdown(finances: Dict[str, Any]) -> None:
-    """
-    Render budget breakdown visualization.
-
-    Args:
-        finances: Financial data dictionary
-    """
+@st.cache_data(show_spinner=False)
+def _budget_pie(designer_total: float, expenses_misc: float, profit: float):
+    """Build the budget pie figure, cached on its three input values so
+    unchanged budgets skip Plotly's figure validation entirely."""
     import plotly.graph_objects as go
 
-    summary = get_financial_summary(finances)
-
-    # Budget breakdown chart
-    st.markdown("### 📊 Budget Breakdown")
     fig = go.Figure(data=[go.Pie(
         labels=['Designer (Jared)', 'Misc Expenses', 'Your Profit'],
         values=[
-            finances.get('designer_total', 20000),
-            finances.get('expenses_misc', 3000),
-            max(0, summary['profit'])  # Ensure non-negative for display
+            designer_total,
+            expenses_misc,
+            max(0, profit)  # Ensure non-negative for display
         ],
         hole=.6,
         marker_colors=[COLORS['info'], COLORS['warning'], COLORS['success']]
@@ -205,4 +226,22 @@ def render_budget_breakdown(finances: Dict[str, Any]) -> None:
             x=0.5
         )
     )
+    return fig
+
+def render_budget_breakdown(finances: Dict[str, Any]) -> None:
+    """
+    Render budget breakdown visualization.
+
+    Args:
+        finances: Financial data dictionary
+    """
+    summary = get_financial_summary(finances)
+
+    # Budget breakdown chart
+    st.markdown("### 📊 Budget Breakdown")
+    fig = _budget_pie(
+        finances.get('designer_total', 20000),
+        finances.get('expenses_misc', 3000),
+        summary['profit'],
+    )
     st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
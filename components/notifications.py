@@ -3,64 +3,55 @@ Notification components for Point Jewels Dashboard
 Smart notification system for alerts and updates.
 """
 
+import json
 from typing import Dict, Any, List
 import streamlit as st
-from utils.config import COLORS
-from utils.helpers import html_escape, is_task_overdue, get_days_remaining
+import streamlit.components.v1 as components
+from utils.helpers import get_days_remaining, build_task_table, task_flags
+
+# Type → stylesheet class; the keyframes and toast styling live in the
+# global CSS injected once at startup
+_TOAST_CLASSES = {
+    'success': 'toast-success',
+    'error': 'toast-error',
+    'warning': 'toast-warning',
+    'info': 'toast-info'
+}
 
 def render_toast() -> None:
-    """Render toast notification if one exists."""
+    """Render toast notification if one exists.
+
+    The toast element is created in the parent document by a small
+    script, so the 4-second auto-dismiss runs entirely client-side via
+    setTimeout — no server rerun is needed to show or hide it. The
+    .toast styling comes from the global stylesheet as before.
+    """
     if st.session_state.toast_message:
-        toast_colors = {
-            'success': COLORS['success'],
-            'error': COLORS['danger'],
-            'warning': COLORS['warning'],
-            'info': COLORS['info']
-        }
-
-        # Enhanced toast with progress ring and better animations
-        st.markdown(f"""
-        <div style="
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: {toast_colors.get(st.session_state.toast_type, COLORS['info'])};
-            color: white;
-            padding: 16px 24px;
-            border-radius: 12px;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-            z-index: 1000;
-            animation: slideInBounce 0.5s cubic-bezier(0.68, -0.55, 0.265, 1.55);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255,255,255,0.2);
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        ">
-            <div style="
-                width: 20px;
-                height: 20px;
-                border: 2px solid rgba(255,255,255,0.3);
-                border-top: 2px solid white;
-                border-radius: 50%;
-                animation: spin 1s linear infinite;
-            "></div>
-            <span style="font-weight: 500; font-size: 14px;">{html_escape(st.session_state.toast_message)}</span>
-        </div>
-        <style>
-            @keyframes slideInBounce {{
-                0% {{ transform: translateX(100%) scale(0.8); opacity: 0; }}
-                50% {{ transform: translateX(-10px) scale(1.05); }}
-                100% {{ transform: translateX(0) scale(1); opacity: 1; }}
-            }}
-            @keyframes spin {{
-                0% {{ transform: rotate(0deg); }}
-                100% {{ transform: rotate(360deg); }}
-            }}
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Auto-clear toast after 4 seconds with fade out
+        toast_class = _TOAST_CLASSES.get(st.session_state.toast_type, 'toast-info')
+        payload = json.dumps({
+            "cls": f"toast {toast_class}",
+            "msg": st.session_state.toast_message,
+        })
+
+        components.html(f"""
+        <script>
+        (function() {{
+            const p = {payload};
+            const doc = window.parent.document;
+            const toast = doc.createElement("div");
+            toast.className = p.cls;
+            const spinner = doc.createElement("div");
+            spinner.className = "spinner";
+            const text = doc.createElement("span");
+            text.style.cssText = "font-weight: 500; font-size: 14px;";
+            text.textContent = p.msg;
+            toast.append(spinner, text);
+            doc.body.appendChild(toast);
+            setTimeout(() => toast.remove(), 4000);
+        }})();
+        </script>
+        """, height=0)
+
         st.session_state.toast_message = None
 
 def show_toast(message: str, toast_type: str = 'success') -> None:
@@ -85,10 +76,14 @@ def render_advanced_notifications() -> List[Dict[str, Any]]:
     # For now, return empty list as placeholder
     return []
 
+@st.cache_data(show_spinner=False, ttl=60)
 def generate_notifications(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Generate contextual notifications based on project data.
 
+    Cached per data version (with a short TTL since deadline-based
+    alerts are time-sensitive) so unrelated widget reruns skip the scan.
+
     Args:
         data: Project data dictionary
 
@@ -96,20 +91,27 @@ def generate_notifications(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         List of notification dictionaries
     """
     notifications = []
+    tasks = data["tasks"]
+
+    # Per-task overdue/days-left flags in one vectorized pass
+    flags = task_flags(tasks)
+    incomplete = build_task_table(tasks)["status"] != "completed"
 
     # Check for overdue tasks
-    overdue_tasks = [t for t in data["tasks"] if is_task_overdue(t) and t["status"] != "completed"]
-    if overdue_tasks:
+    overdue_count = int(flags["overdue"].sum())
+    if overdue_count:
         notifications.append({
             'type': 'urgent',
-            'title': f"{len(overdue_tasks)} Overdue Task{'s' if len(overdue_tasks) > 1 else ''}",
-            'message': f"You have {len(overdue_tasks)} task{'s' if len(overdue_tasks) > 1 else ''} past their deadline.",
+            'title': f"{overdue_count} Overdue Task{'s' if overdue_count > 1 else ''}",
+            'message': f"You have {overdue_count} task{'s' if overdue_count > 1 else ''} past their deadline.",
             'action': 'View Tasks'
         })
 
     # Check budget warnings
     finances = data["finances"]
-    budget_used = ((sum(finances.get('received', [])) + sum(finances.get('paid_out', []))) / finances.get('budget_total', 1)) * 100
+    received_total = sum(p["amount"] for p in finances.get('received', []))
+    paid_total = sum(p["amount"] for p in finances.get('paid_out', []))
+    budget_used = ((received_total + paid_total) / finances.get('budget_total', 1)) * 100
     if budget_used > 90:
         notifications.append({
             'type': 'budget',
@@ -119,22 +121,12 @@ def generate_notifications(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         })
 
     # Check upcoming deadlines (next 3 days)
-    upcoming_tasks = []
-    for task in data["tasks"]:
-        if task["status"] != "completed":
-            try:
-                deadline = datetime.strptime(task["deadline"], "%Y-%m-%d")
-                days_until = (deadline - datetime.now()).days
-                if 0 <= days_until <= 3:
-                    upcoming_tasks.append(task)
-            except ValueError:
-                continue
-
-    if upcoming_tasks:
+    upcoming_count = int(((flags["days_left"] >= 0) & (flags["days_left"] <= 3) & incomplete).sum())
+    if upcoming_count:
         notifications.append({
             'type': 'warning',
-            'title': f"{len(upcoming_tasks)} Task{'s' if len(upcoming_tasks) > 1 else ''} Due Soon",
-            'message': f"You have {len(upcoming_tasks)} task{'s' if len(upcoming_tasks) > 1 else ''} due within 3 days.",
+            'title': f"{upcoming_count} Task{'s' if upcoming_count > 1 else ''} Due Soon",
+            'message': f"You have {upcoming_count} task{'s' if upcoming_count > 1 else ''} due within 3 days.",
             'action': 'View Tasks'
         })
 
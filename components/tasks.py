@@ -4,28 +4,51 @@ Specialized components for task management UI.
 """
 
 from typing import Dict, Any, List
+
+import numpy as np
+import streamlit as st
+
 from utils.config import COLORS, ICONS
-from utils.helpers import html_escape, is_task_overdue
+from utils.helpers import html_escape, is_task_overdue, build_task_table, overdue_mask_for
 from components.ui import render_status_indicator, render_badge
 
-def get_priority_badge(priority: str) -> str:
-    """Get HTML for priority badge."""
-    priority_colors = {
-        "critical": "#dc2626",
-        "high": "#ea580c",
-        "medium": "#ca8a04",
-        "low": "#16a34a"
-    }
+# Shared priority lookup tables, built once at import
+_PRIORITY_COLORS = {
+    "critical": "#dc2626",
+    "high": "#ea580c",
+    "medium": "#ca8a04",
+    "low": "#16a34a"
+}
 
-    priority_icons = {
-        "critical": "🔴",
-        "high": "🟠",
-        "medium": "🟡",
-        "low": "🟢"
-    }
+_PRIORITY_ICONS = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🟢"
+}
 
-    color = priority_colors.get(priority, "#6b7280")
-    icon = priority_icons.get(priority, "⚪")
+# Task card template, precompiled at import with the color constants
+# baked in; only the per-task fields are substituted per call
+_TASK_CARD_TPL = (
+    '<div class="task-card {card_class}" style="'
+    'border-left: 4px solid {priority_color}; position: relative; overflow: hidden;" '
+    'role="article" aria-label="{aria_label}" tabindex="0">'
+    '<div style="position: absolute; top: 8px; right: 8px; opacity: 0.7;">{status_indicator}</div>'
+    '<div style="display: flex; justify-content: space-between; align-items: center; padding-right: 30px;">'
+    '<span style="font-size: 16px; color: white; font-weight: 500;">{status_icon} {task_text}</span>'
+    '{priority_badge}</div>'
+    f'<div style="margin-top: 8px; color: {COLORS["text_dark"]}; font-size: 13px;">'
+    '📅 Due: {deadline} | 👤 {assignee} | Week {week}</div>'
+    '<div style="position: absolute; bottom: 0; left: 0; height: 3px; '
+    'background: linear-gradient(90deg, {priority_color} 0%, transparent 100%); '
+    'width: {bar_width}%; transition: width 0.3s ease;"></div>'
+    '</div>'
+)
+
+def _build_priority_badge(priority: str) -> str:
+    """Assemble the badge HTML for a priority level."""
+    color = _PRIORITY_COLORS.get(priority, "#6b7280")
+    icon = _PRIORITY_ICONS.get(priority, "⚪")
 
     return f"""
     <span style="
@@ -45,74 +68,79 @@ def get_priority_badge(priority: str) -> str:
     </span>
     """
 
-def render_task_card(task: Dict[str, Any]) -> None:
+# The four known badges are fully rendered at import; unknown priorities
+# fall back to building on the fly
+_PRIORITY_BADGES = {p: _build_priority_badge(p) for p in _PRIORITY_COLORS}
+
+# Task cards only ever show these three indicator states, so the spans
+# are rendered once at import and indexed per card
+_STATUS_INDICATORS = {k: render_status_indicator(k) for k in ("completed", "overdue", "pending")}
+
+# Common task patterns for the jewelry website, paired with their
+# lowercased form so matching never re-lowercases per keystroke
+_COMMON_PATTERNS = [
+    (p, p.lower()) for p in (
+        "Review and approve",
+        "Schedule meeting with",
+        "Update project timeline for",
+        "Send payment reminder to",
+        "Check progress on",
+        "Create content for",
+        "Test functionality of",
+        "Document requirements for",
+        "Coordinate with",
+        "Finalize design for",
+    )
+]
+
+def get_priority_badge(priority: str) -> str:
+    """Get HTML for priority badge."""
+    badge = _PRIORITY_BADGES.get(priority)
+    return badge if badge is not None else _build_priority_badge(priority)
+
+def render_task_card(task: Dict[str, Any]) -> str:
     """
-    Render a single task card with enhanced visual feedback and accessibility.
+    Build a single task card with enhanced visual feedback and accessibility.
+
+    Returns HTML rather than rendering directly so callers can join many
+    cards into one st.markdown call (one render delta instead of N).
 
     Args:
         task: Task data dictionary
-    """
-    import streamlit as st
 
+    Returns:
+        HTML string for the task card
+    """
     status_icon = ICONS["completed"] if task["status"] == "completed" else ICONS["pending"]
     is_overdue_flag = is_task_overdue(task)
     card_class = "task-complete" if task["status"] == "completed" else ("task-overdue" if is_overdue_flag else "task-pending")
     priority_badge = get_priority_badge(task["priority"])
 
     # Status indicator for the card
-    status_indicator = render_status_indicator(
+    status_indicator = _STATUS_INDICATORS[
         "completed" if task["status"] == "completed" else "overdue" if is_overdue_flag else "pending"
-    )
+    ]
 
-    # Priority color coding
-    priority_colors = {
-        "critical": "#dc2626",
-        "high": "#ea580c",
-        "medium": "#ca8a04",
-        "low": "#16a34a"
-    }
-    priority_color = priority_colors.get(task["priority"], "#6b7280")
+    priority_color = _PRIORITY_COLORS.get(task["priority"], "#6b7280")
 
     # Accessibility attributes
     aria_label = f"Task: {html_escape(task['task'])}. Status: {html_escape(task['status'])}. Priority: {html_escape(task['priority'])}. Due: {html_escape(task['deadline'])}. Assigned to: {html_escape(task['assignee'])}"
     if is_overdue_flag:
         aria_label += ". This task is overdue."
 
-    st.markdown(f"""
-    <div class="task-card {card_class}" style="
-        border-left: 4px solid {priority_color};
-        position: relative;
-        overflow: hidden;
-    "
-    role="article"
-    aria-label="{aria_label}"
-    tabindex="0">
-        <div style="
-            position: absolute;
-            top: 8px;
-            right: 8px;
-            opacity: 0.7;
-        ">
-            {status_indicator}
-        </div>
-        <div style="display: flex; justify-content: space-between; align-items: center; padding-right: 30px;">
-            <span style="font-size: 16px; color: white; font-weight: 500;">{status_icon} {html_escape(task['task'])}</span>
-            {priority_badge}
-        </div>
-        <div style="margin-top: 8px; color: {COLORS['text_dark']}; font-size: 13px;">
-            📅 Due: {html_escape(task['deadline'])} | 👤 {html_escape(task['assignee'])} | Week {task['week']}
-        </div>
-        <div style="
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            height: 3px;
-            background: linear-gradient(90deg, {priority_color} 0%, transparent 100%);
-            width: {80 if task['status'] == 'completed' else 40}%;
-            transition: width 0.3s ease;
-        "></div>
-    </div>
-    """, unsafe_allow_html=True)
+    return _TASK_CARD_TPL.format(
+        card_class=card_class,
+        priority_color=priority_color,
+        aria_label=aria_label,
+        status_indicator=status_indicator,
+        status_icon=status_icon,
+        task_text=html_escape(task['task']),
+        priority_badge=priority_badge,
+        deadline=html_escape(task['deadline']),
+        assignee=html_escape(task['assignee']),
+        week=task['week'],
+        bar_width=80 if task['status'] == 'completed' else 40,
+    )
 
 def render_task_filters(current_filter: str) -> str:
     """
@@ -150,6 +178,41 @@ def render_task_filters(current_filter: str) -> str:
 
     return selected_filter
 
+def select_tasks(tasks: List[Dict[str, Any]], week: int = None, status: str = None,
+                 priority: str = None, overdue: bool = False) -> List[Dict[str, Any]]:
+    """
+    Select tasks matching every given criterion.
+
+    Criteria are intersected as boolean masks over the cached column
+    table, so combining dimensions stays a few vectorized ANDs rather
+    than chained list scans.
+
+    Args:
+        tasks: List of task dictionaries
+        week: Restrict to a project week
+        status: Restrict to a task status
+        priority: Restrict to a priority level
+        overdue: Restrict to incomplete tasks past their deadline
+
+    Returns:
+        Filtered list of tasks
+    """
+    if not tasks:
+        return []
+
+    table = build_task_table(tasks)
+    mask = np.ones(len(tasks), dtype=bool)
+    if week is not None:
+        mask &= table["week"] == week
+    if status is not None:
+        mask &= table["status"] == status
+    if priority is not None:
+        mask &= table["priority"] == priority
+    if overdue:
+        mask &= overdue_mask_for(tasks)
+
+    return [tasks[i] for i in np.nonzero(mask)[0]]
+
 def filter_tasks(tasks: List[Dict[str, Any]], filter_type: str) -> List[Dict[str, Any]]:
     """
     Filter tasks based on filter type.
@@ -161,23 +224,27 @@ def filter_tasks(tasks: List[Dict[str, Any]], filter_type: str) -> List[Dict[str
     Returns:
         Filtered list of tasks
     """
-    if filter_type == "all":
+    if filter_type == "all" or not tasks:
         return tasks
     elif filter_type == "pending":
-        return [t for t in tasks if t["status"] == "pending"]
+        return select_tasks(tasks, status="pending")
     elif filter_type == "completed":
-        return [t for t in tasks if t["status"] == "completed"]
+        return select_tasks(tasks, status="completed")
     elif filter_type == "overdue":
-        return [t for t in tasks if is_task_overdue(t) and t["status"] != "completed"]
+        return select_tasks(tasks, overdue=True)
     elif filter_type == "critical":
-        return [t for t in tasks if t["priority"] == "critical"]
+        return select_tasks(tasks, priority="critical")
     else:
         return tasks
 
+@st.cache_data(show_spinner=False)
 def render_smart_suggestions(task_input: str, existing_tasks: List[Dict[str, Any]]) -> List[str]:
     """
     Generate smart task suggestions based on input and existing tasks.
 
+    Pure function of its inputs, so results are memoized per
+    (input, task list) pair.
+
     Args:
         task_input: Current task input text
         existing_tasks: List of existing tasks
@@ -189,28 +256,19 @@ def render_smart_suggestions(task_input: str, existing_tasks: List[Dict[str, Any
         return []
 
     suggestions = []
+    # Lowercase and tokenize the input exactly once per call
     input_lower = task_input.lower()
+    input_tokens = input_lower.split()
+    # Existing names lowered once up front, so the dedup check below is a
+    # hash lookup with no per-suggestion .lower() calls
+    existing_lower = {t["task"].lower() for t in existing_tasks}
 
-    # Common task patterns for jewelry website
-    common_patterns = [
-        "Review and approve",
-        "Schedule meeting with",
-        "Update project timeline for",
-        "Send payment reminder to",
-        "Check progress on",
-        "Create content for",
-        "Test functionality of",
-        "Document requirements for",
-        "Coordinate with",
-        "Finalize design for"
-    ]
-
-    # Generate suggestions based on input
-    for pattern in common_patterns:
-        if any(word in pattern.lower() for word in input_lower.split()):
-            suggestion = f"{pattern} {task_input}"
-            if suggestion not in [t["task"] for t in existing_tasks]:
-                suggestions.append(suggestion)
+    # Generate suggestions based on input, stopping at the display cap
+    for pattern, pattern_lower in _COMMON_PATTERNS:
+        if any(word in pattern_lower for word in input_tokens):
+            if f"{pattern_lower} {input_lower}" not in existing_lower:
+                suggestions.append(f"{pattern} {task_input}")
+                if len(suggestions) == 3:
+                    break
 
-    # Limit to 3 suggestions
-    return suggestions[:3]
\ No newline at end of file
+    return suggestions
\ No newline at end of file
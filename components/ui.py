@@ -3,37 +3,33 @@ Reusable UI Components for Point Jewels Dashboard
 Modular components for consistent UI patterns.
 """
 
+import math
+from functools import lru_cache
+
 from utils.config import COLORS
 from utils.helpers import html_escape
 
-def render_progress_ring(percentage: float, size: int = 80, color: str = COLORS['gold'], label: str = "") -> str:
-    """
-    Render a circular progress ring with consistent styling.
-
-    Args:
-        percentage: Progress percentage (0-100)
-        size: Ring diameter in pixels
-        color: Ring color (hex or named color)
-        label: Optional label below the ring
+@lru_cache(maxsize=512)
+def _progress_ring_body(pct: int, size: int, color: str) -> str:
+    """SVG + centered percentage for a ring, memoized per distinct state.
 
-    Returns:
-        HTML string for the progress ring
+    Percentages are bucketed to whole ints by the caller, so the cache
+    covers at most 101 entries per (size, color) combination.
     """
-    # Ensure percentage is between 0 and 100
-    percentage = max(0, min(100, percentage))
-
-    # Calculate the stroke-dasharray values
-    circumference = 2 * 3.14159 * (size / 2 - 4)  # radius = size/2 - stroke_width/2
-    stroke_dasharray = f"{circumference * percentage / 100} {circumference}"
+    center = size / 2
+    radius = center - 4  # radius = size/2 - stroke_width/2
+    circumference = math.tau * radius
+    # Two decimals is plenty of precision for SVG and keeps the attribute
+    # (and websocket payload) short instead of a 17-digit float repr
+    stroke_dasharray = f"{circumference * pct / 100:.2f} {circumference:.2f}"
 
     return f"""
-    <div style="position: relative; width: {size}px; height: {size}px; display: inline-block;">
         <svg width="{size}" height="{size}" style="transform: rotate(-90deg);">
             <!-- Background circle -->
-            <circle cx="{size/2}" cy="{size/2}" r="{size/2 - 4}"
+            <circle cx="{center}" cy="{center}" r="{radius}"
                     stroke="rgba(255,255,255,0.2)" stroke-width="4" fill="none"/>
             <!-- Progress circle -->
-            <circle cx="{size/2}" cy="{size/2}" r="{size/2 - 4}"
+            <circle cx="{center}" cy="{center}" r="{radius}"
                     stroke="{color}" stroke-width="4" fill="none"
                     stroke-dasharray="{stroke_dasharray}" stroke-linecap="round"/>
         </svg>
@@ -46,9 +42,36 @@ def render_progress_ring(percentage: float, size: int = 80, color: str = COLORS[
             font-weight: bold;
             color: white;
         ">
-            {int(percentage)}%
+            {pct}%
         </div>
-        {f'<div style="position: absolute; top: {size + 5}px; left: 50%; transform: translateX(-50%); font-size: 10px; color: rgba(255,255,255,0.7); white-space: nowrap;">{label}</div>' if label else ''}
+    """
+
+def render_progress_ring(percentage: float, size: int = 80, color: str = COLORS['gold'], label: str = "") -> str:
+    """
+    Render a circular progress ring with consistent styling.
+
+    Args:
+        percentage: Progress percentage (0-100)
+        size: Ring diameter in pixels
+        color: Ring color (hex or named color)
+        label: Optional label below the ring
+
+    Returns:
+        HTML string for the progress ring
+    """
+    # Bucket to a whole percentage between 0 and 100 (also the cache key)
+    pct = int(round(max(0, min(100, percentage))))
+
+    # The label is high-cardinality, so it stays outside the cached body
+    label_html = (
+        f'<div style="position: absolute; top: {size + 5}px; left: 50%; transform: translateX(-50%); font-size: 10px; color: rgba(255,255,255,0.7); white-space: nowrap;">{label}</div>'
+        if label else ''
+    )
+
+    return f"""
+    <div style="position: relative; width: {size}px; height: {size}px; display: inline-block;">
+        {_progress_ring_body(pct, size, color)}
+        {label_html}
     </div>
     """
 
@@ -56,6 +79,10 @@ def render_status_indicator(status: str, size: int = 12) -> str:
     """
     Render a status indicator dot with animation.
 
+    Colors, glow and the pulse animation live in the global stylesheet
+    (.status-dot rules), so each call ships a short <span> instead of a
+    block of inline styles repeated per dot.
+
     Args:
         status: Status type ('completed', 'pending', 'overdue', 'active')
         size: Indicator size in pixels
@@ -63,30 +90,7 @@ def render_status_indicator(status: str, size: int = 12) -> str:
     Returns:
         HTML string for the status indicator
     """
-    colors = {
-        'completed': COLORS['success'],
-        'pending': COLORS['warning'],
-        'overdue': COLORS['danger'],
-        'active': COLORS['info'],
-        'warning': COLORS['warning'],
-        'success': COLORS['success'],
-        'error': COLORS['danger']
-    }
-
-    color = colors.get(status, COLORS['text_muted'])
-
-    return f"""
-    <div style="
-        width: {size}px;
-        height: {size}px;
-        border-radius: 50%;
-        background: {color};
-        display: inline-block;
-        margin-right: 8px;
-        box-shadow: 0 0 8px {color}40;
-        animation: pulse 2s infinite;
-    "></div>
-    """
+    return f'<span class="status-dot status-{status}" style="--size: {size}px;"></span>'
 
 def render_badge(text: str, variant: str = "info", size: str = "sm") -> str:
     """
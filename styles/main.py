@@ -2,21 +2,15 @@
 CSS styling utilities for the Point Jewels dashboard.
 """
 
+import hashlib
+from pathlib import Path
+
 import streamlit as st
 from utils.config import COLORS
 
-
-def get_custom_css() -> str:
-    """
-    Load and return the custom CSS styles for the dashboard.
-
-    Returns:
-        str: The complete CSS stylesheet as a string
-    """
-    try:
-        # Simple test CSS
-        css_template = """
-        <style>
+# The raw stylesheet, static at runtime; get_custom_css wraps it for
+# inline injection and get_css_link serves it as a cacheable file
+_STYLESHEET = """
             body {
                 background-color: #0f0f0f;
                 color: #d4af37;
@@ -48,9 +42,133 @@ def get_custom_css() -> str:
                 from { opacity: 0; transform: translateY(20px); }
                 to { opacity: 1; transform: translateY(0); }
             }
-        </style>
-        """
-        return css_template
-    except Exception as e:
-        st.warning(f"Error loading CSS: {e}. Using default styling.")
-        return ""
+            /* Shared animation keyframes and toast classes, injected once
+               so per-render components never carry their own <style> tags */
+            /* translate3d/rotate3d keep these animations on the GPU
+               compositor instead of triggering layout on every frame */
+            @keyframes slideInBounce {
+                0% { transform: translate3d(100%, 0, 0) scale(0.8); opacity: 0; }
+                50% { transform: translate3d(-10px, 0, 0) scale(1.05); }
+                100% { transform: translate3d(0, 0, 0) scale(1); opacity: 1; }
+            }
+            @keyframes spin {
+                0% { transform: rotate3d(0, 0, 1, 0deg); }
+                100% { transform: rotate3d(0, 0, 1, 360deg); }
+            }
+            @media (prefers-reduced-motion: reduce) {
+                .toast, .toast .spinner, .fade-in {
+                    animation: none;
+                }
+                /* The spinner is pure decoration; drop it entirely so the
+                   compositor never considers it */
+                .toast .spinner {
+                    display: none;
+                }
+                .toast {
+                    will-change: auto;
+                }
+            }
+            @keyframes pulse {
+                0%, 100% { opacity: 1; }
+                50% { opacity: 0.5; }
+            }
+            /* Status dots: all styling lives here so render_status_indicator
+               only emits a <span> with a class and a --size variable */
+            .status-dot {
+                width: var(--size, 12px);
+                height: var(--size, 12px);
+                border-radius: 50%;
+                background: #a0a0a0;
+                display: inline-block;
+                margin-right: 8px;
+                animation: pulse 2s infinite;
+            }
+            .status-dot.status-completed, .status-dot.status-success {
+                background: #10b981;
+                box-shadow: 0 0 8px #10b98140;
+            }
+            .status-dot.status-pending, .status-dot.status-warning {
+                background: #f59e0b;
+                box-shadow: 0 0 8px #f59e0b40;
+            }
+            .status-dot.status-overdue, .status-dot.status-error {
+                background: #ef4444;
+                box-shadow: 0 0 8px #ef444440;
+            }
+            .status-dot.status-active {
+                background: #3b82f6;
+                box-shadow: 0 0 8px #3b82f640;
+            }
+            .toast {
+                position: fixed;
+                top: 20px;
+                right: 20px;
+                color: white;
+                padding: 16px 24px;
+                border-radius: 12px;
+                box-shadow: 0 8px 32px rgba(0,0,0,0.3);
+                z-index: 1000;
+                animation: slideInBounce 0.5s cubic-bezier(0.68, -0.55, 0.265, 1.55);
+                backdrop-filter: blur(10px);
+                border: 1px solid rgba(255,255,255,0.2);
+                display: flex;
+                align-items: center;
+                gap: 12px;
+                will-change: transform, opacity;
+                transform: translateZ(0);
+            }
+            .toast-success { background: #10b981; }
+            .toast-error { background: #ef4444; }
+            .toast-warning { background: #f59e0b; }
+            .toast-info { background: #3b82f6; }
+            .toast .spinner {
+                width: 20px;
+                height: 20px;
+                border: 2px solid rgba(255,255,255,0.3);
+                border-top: 2px solid white;
+                border-radius: 50%;
+                animation: spin 1s linear infinite;
+            }
+"""
+
+
+@st.cache_resource
+def get_custom_css() -> str:
+    """
+    Load and return the custom CSS styles for the dashboard.
+
+    The stylesheet never changes at runtime, so it is built exactly once
+    per process and reused on every rerun.
+
+    Returns:
+        str: The complete CSS stylesheet as a string
+    """
+    return f"<style>{_STYLESHEET}</style>"
+
+
+@st.cache_resource
+def get_css_link() -> str:
+    """
+    Write the stylesheet to static/theme.css once and return a <link>
+    tag pointing at it.
+
+    The browser caches the file across sessions (the hash suffix busts
+    that cache when the CSS changes), so each rerun ships a ~70-byte
+    link instead of the whole stylesheet. Requires
+    server.enableStaticServing; falls back to inline injection if the
+    static directory can't be written.
+
+    Returns:
+        str: HTML linking (or inlining) the stylesheet
+    """
+    try:
+        static_dir = Path(__file__).resolve().parent.parent / "static"
+        static_dir.mkdir(exist_ok=True)
+        css_path = static_dir / "theme.css"
+        if not css_path.exists() or css_path.read_text() != _STYLESHEET:
+            css_path.write_text(_STYLESHEET)
+        digest = hashlib.md5(_STYLESHEET.encode()).hexdigest()[:8]
+        return f'<link rel="stylesheet" href="app/static/theme.css?v={digest}">'
+    except OSError as e:
+        st.warning(f"Error writing static CSS: {e}. Falling back to inline styles.")
+        return get_custom_css()
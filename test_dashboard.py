@@ -237,6 +237,62 @@ class TestDataPersistence:
         assert loaded_data["project"]["name"] == "Test Project"
         assert loaded_data["tasks"][0]["task"] == "Test task"
 
+    @pytest.fixture
+    def helpers_with_tmp_file(self, tmp_path, monkeypatch):
+        """utils.helpers redirected to a temporary data file."""
+        # Imported here so the rest of the suite stays Streamlit-free
+        from utils import helpers
+
+        monkeypatch.setattr(helpers, "DATA_FILE", tmp_path / "project_data.json")
+        monkeypatch.setattr(helpers, "_last_saved_digest", None)
+        helpers._load_cached.clear()
+        return helpers
+
+    def test_save_strips_derived_fields_keeps_next_id(self, helpers_with_tmp_file):
+        """Round-trip drops _deadline_ts from tasks but persists _next_id."""
+        helpers = helpers_with_tmp_file
+        data = {
+            "project": {"name": "Test", "current_week": 1, "launch_date": "2025-01-12"},
+            "tasks": [{"id": 1, "task": "Test task", "week": 1, "deadline": "2024-12-02",
+                       "status": "pending", "assignee": "You", "priority": "high",
+                       "_deadline_ts": 123.0}],
+            "finances": {},
+            "_next_id": 2,
+        }
+
+        helpers.save_data(data)
+        on_disk = json.loads(helpers.DATA_FILE.read_bytes())
+
+        assert "_deadline_ts" not in on_disk["tasks"][0]
+        assert on_disk["_next_id"] == 2
+        assert not helpers.DATA_FILE.with_suffix(".json.tmp").exists()
+
+        # Loading annotates tasks again and keeps the counter
+        loaded = helpers.load_data()
+        assert loaded["_next_id"] == 2
+        assert "_deadline_ts" in loaded["tasks"][0]
+
+    def test_identical_save_skips_write(self, helpers_with_tmp_file):
+        """A second save of unchanged data must not touch the file."""
+        helpers = helpers_with_tmp_file
+        data = {
+            "project": {"name": "Test", "current_week": 1, "launch_date": "2025-01-12"},
+            "tasks": [],
+            "finances": {},
+            "_next_id": 1,
+        }
+
+        helpers.save_data(data)
+        first_mtime = helpers.DATA_FILE.stat().st_mtime_ns
+
+        helpers.save_data(data)
+        assert helpers.DATA_FILE.stat().st_mtime_ns == first_mtime
+
+        # A real change must write again
+        data["project"]["current_week"] = 2
+        helpers.save_data(data)
+        assert helpers.DATA_FILE.stat().st_mtime_ns != first_mtime
+
 class TestDataValidation:
     """Test data structure validation."""
 
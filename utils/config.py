@@ -35,6 +35,15 @@ COLORS = {
     'info': '#3b82f6',           # Blue
 }
 
+# Shared status → color lookup, built once so render loops don't allocate
+# a fresh dict per iteration
+STATUS_COLOR_MAP = {
+    'completed': COLORS['success'],
+    'pending': COLORS['warning'],
+    'overdue': COLORS['danger'],
+    'active': COLORS['info'],
+}
+
 # ============================================================================
 # ICON SYSTEM (Luxury Jewelry Theme)
 # ============================================================================
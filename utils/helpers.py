@@ -3,32 +3,103 @@ Utility functions for Point Jewels Dashboard
 Helper functions for data processing, validation, and common operations.
 """
 
+import copy
+import hashlib
 import json
+import os
 from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json if orjson isn't installed
+    orjson = None
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+import numpy as np
+import streamlit as st
+
 # ============================================================================
 # DATA MANAGEMENT
 # ============================================================================
 
-DATA_FILE = Path("project_data.json")
+# Anchored to the package directory so loads don't depend on the cwd
+# the app happened to be launched from
+DATA_FILE = Path(__file__).resolve().parent.parent / "project_data.json"
+
+@st.cache_data(show_spinner=False)
+def _load_cached(mtime: int) -> Dict[str, Any]:
+    """Parse the data file once per on-disk version (keyed on mtime)."""
+    if orjson is not None:
+        data = orjson.loads(DATA_FILE.read_bytes())
+    else:
+        with open(DATA_FILE, 'r') as f:
+            data = json.load(f)
+    # Parse deadlines once at load time so overdue checks are a plain
+    # float comparison instead of strptime per call
+    for task in data.get("tasks", []):
+        parsed = _parse_deadline(task.get("deadline", ""))
+        task["_deadline_ts"] = parsed.timestamp() if parsed else float("inf")
+    # Monotonic id counter: seeded from the highest existing id, then
+    # persisted so adds are O(1) and ids stay unique across deletions
+    data.setdefault("_next_id", max((t.get("id", 0) for t in data.get("tasks", [])), default=0) + 1)
+    return data
 
 def load_data() -> Dict[str, Any]:
     """Load project data or create defaults."""
     if DATA_FILE.exists():
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
+        # Nanosecond mtime: the float form can collapse writes landing
+        # within the same timestamp granularity into one cache key
+        return _load_cached(DATA_FILE.stat().st_mtime_ns)
     return get_default_data()
 
+# Digest of the last payload written this process; lets save_data skip
+# the disk write and cache invalidation when nothing actually changed
+_last_saved_digest: Optional[bytes] = None
+
 def save_data(data: Dict[str, Any]) -> None:
     """Save project data to JSON file."""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    global _last_saved_digest
+    serializable = dict(data)
+    # Derived underscore-prefixed fields (e.g. _deadline_ts) stay in memory only
+    serializable["tasks"] = [
+        {k: v for k, v in task.items() if not k.startswith("_")}
+        for task in data.get("tasks", [])
+    ]
+    if orjson is not None:
+        payload = orjson.dumps(serializable, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(serializable, indent=2).encode()
+    # Identical payload means a no-op save: skip the write and leave all
+    # derived caches (which reflect this exact data) warm
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if digest == _last_saved_digest:
+        return
+    _last_saved_digest = digest
+    # Write-then-rename so a crash mid-write can't leave a truncated file
+    tmp_file = DATA_FILE.with_suffix(".json.tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, DATA_FILE)
+    # Invalidate the read cache and derived aggregates so the next
+    # load_data()/stats call picks up the new file
+    _load_cached.clear()
+    build_task_table.clear()
+    tasks_by_week.clear()
+    build_payment_table.clear()
+    get_task_stats.clear()
+    get_financial_summary.clear()
+    optimize_performance.clear()
+    # Component-level caches key on the same data; imported lazily to
+    # avoid a module cycle (components import utils.helpers)
+    from components.notifications import generate_notifications
+    from components.tasks import render_smart_suggestions
+    generate_notifications.clear()
+    render_smart_suggestions.clear()
 
-def get_default_data() -> Dict[str, Any]:
-    """Return default project data structure."""
-    return {
+# Prototype built once at import; get_default_data hands out deep copies
+# so callers can mutate their instance freely
+_DEFAULT_DATA = {
         "project": {
             "name": "Point Jewels Website",
             "status": "In Progress",
@@ -54,6 +125,10 @@ def get_default_data() -> Dict[str, Any]:
         "settings": {}
     }
 
+def get_default_data() -> Dict[str, Any]:
+    """Return default project data structure."""
+    return copy.deepcopy(_DEFAULT_DATA)
+
 # ============================================================================
 # SECURITY & SANITIZATION
 # ============================================================================
@@ -75,26 +150,71 @@ def html_escape(s: Any) -> str:
 # BUSINESS LOGIC HELPERS
 # ============================================================================
 
+@st.cache_data(show_spinner=False)
+def build_task_table(tasks: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Build a column-oriented (struct-of-arrays) view of the task list.
+
+    Stats and filters reduce over these parallel arrays instead of
+    iterating Python dicts; the table is cached per data version.
+    """
+    deadline_ts = []
+    for task in tasks:
+        parsed = _parse_deadline(task.get("deadline", ""))
+        deadline_ts.append(parsed.timestamp() if parsed else np.inf)
+
+    return {
+        "id": np.asarray([task.get("id", 0) for task in tasks], dtype=np.int64),
+        "status": np.asarray([task.get("status", "") for task in tasks]),
+        "priority": np.asarray([task.get("priority", "") for task in tasks]),
+        "week": np.asarray([task.get("week", 0) for task in tasks], dtype=np.int64),
+        "deadline_ts": np.asarray(deadline_ts, dtype=np.float64),
+    }
+
+@st.cache_data(show_spinner=False)
+def tasks_by_week(tasks: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+    """Group tasks by week once per data version instead of rescanning."""
+    by_week: Dict[int, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        by_week.setdefault(task.get("week", 0), []).append(task)
+    return by_week
+
+@st.cache_data(show_spinner=False, ttl=60)
 def get_task_stats(tasks: List[Dict[str, Any]]) -> Dict[str, int]:
     """Calculate task statistics."""
-    total = len(tasks)
-    completed = sum(1 for task in tasks if task["status"] == "completed")
-    pending = total - completed
-    overdue = sum(1 for task in tasks if is_task_overdue(task) and task["status"] != "completed")
+    if not tasks:
+        return {"total": 0, "completed": 0, "pending": 0, "overdue": 0}
 
+    completed = int((build_task_table(tasks)["status"] == "completed").sum())
+
+    total = len(tasks)
     return {
         "total": total,
         "completed": completed,
-        "pending": pending,
-        "overdue": overdue
+        "pending": total - completed,
+        "overdue": int(overdue_mask_for(tasks).sum())
     }
 
+@st.cache_data(show_spinner=False)
+def build_payment_table(payments: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Column view of a payment list (amounts + statuses), cached per version."""
+    return {
+        "amount": np.asarray([p.get("amount", 0) for p in payments], dtype=np.int64),
+        "status": np.asarray([p.get("status", "") for p in payments]),
+    }
+
+@st.cache_data(show_spinner=False)
 def get_financial_summary(finances: Dict[str, Any]) -> Dict[str, float]:
     """Calculate financial summary."""
-    received = sum(p["amount"] for p in finances["received"] if p.get("status") == "received")
-    pending_in = sum(p["amount"] for p in finances["pending_in"])
-    paid_out = sum(p["amount"] for p in finances["paid_out"] if p.get("status") == "paid")
-    pending_out = sum(p["amount"] for p in finances["pending_out"])
+    # Contiguous int64 reductions instead of per-dict Python sums; the
+    # totals below reuse these rather than re-walking the lists
+    received_tbl = build_payment_table(finances["received"])
+    paid_tbl = build_payment_table(finances["paid_out"])
+
+    received = int(received_tbl["amount"][received_tbl["status"] == "received"].sum())
+    paid_out = int(paid_tbl["amount"][paid_tbl["status"] == "paid"].sum())
+    pending_in = int(build_payment_table(finances["pending_in"])["amount"].sum())
+    pending_out = int(build_payment_table(finances["pending_out"])["amount"].sum())
 
     total_received = received + pending_in
     total_paid = paid_out + pending_out
@@ -110,21 +230,73 @@ def get_financial_summary(finances: Dict[str, Any]) -> Dict[str, float]:
         "balance": balance
     }
 
+@lru_cache(maxsize=512)
+def _parse_deadline(date_str: str) -> Optional[datetime]:
+    """
+    Parse a YYYY-MM-DD deadline once; repeated checks reuse the result.
+
+    Direct int construction is an order of magnitude faster than strptime,
+    which re-interprets the format string on every call.
+    """
+    try:
+        year, month, day = date_str.split("-")
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
 def is_task_overdue(task: Dict[str, Any]) -> bool:
     """Check if a task is overdue."""
-    try:
-        deadline = datetime.strptime(task["deadline"], "%Y-%m-%d")
-        return deadline < datetime.now()
-    except (ValueError, KeyError):
-        return False
+    deadline_ts = task.get("_deadline_ts")
+    if deadline_ts is None:
+        parsed = _parse_deadline(task.get("deadline", ""))
+        deadline_ts = parsed.timestamp() if parsed else float("inf")
+    return deadline_ts < datetime.now().timestamp()
+
+def overdue_mask_for(tasks: List[Dict[str, Any]]) -> np.ndarray:
+    """Boolean overdue mask over the cached task table (batch form)."""
+    table = build_task_table(tasks)
+    return (table["deadline_ts"] < datetime.now().timestamp()) & (table["status"] != "completed")
+
+def task_flags(tasks: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Batch kernel computing per-task flags in one vectorized pass.
+
+    Returns parallel arrays: 'overdue' (bool mask) and 'days_left'
+    (whole days until each deadline, negative when past; int64 max for
+    missing/unparsable deadlines so due-soon windows never match them).
+    Scales to larger task lists without per-task Python datetime
+    arithmetic.
+    """
+    table = build_task_table(tasks)
+    now_ts = datetime.now().timestamp()
+    finite = np.isfinite(table["deadline_ts"])
+    days_left = np.full(len(tasks), np.iinfo(np.int64).max, dtype=np.int64)
+    days_left[finite] = ((table["deadline_ts"][finite] - now_ts) // 86400).astype(np.int64)
+
+    return {
+        "overdue": overdue_mask_for(tasks),
+        "days_left": days_left,
+    }
+
+def get_sidebar_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    One-stop summary for the sidebar Quick Stats: task stats, overall
+    progress percentage and days to launch in a single call.
+    """
+    stats = get_task_stats(data["tasks"])
+    progress = (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
+    return {
+        "stats": stats,
+        "progress": progress,
+        "days_left": get_days_remaining(data["project"]),
+    }
 
 def get_days_remaining(project: Dict[str, Any]) -> int:
     """Calculate days until launch."""
-    try:
-        launch_date = datetime.strptime(project["launch_date"], "%Y-%m-%d")
-        return max(0, (launch_date - datetime.now()).days)
-    except (ValueError, KeyError):
+    launch_date = _parse_deadline(project.get("launch_date", ""))
+    if launch_date is None:
         return 0
+    return max(0, (launch_date - datetime.now()).days)
 
 # ============================================================================
 # VALIDATION HELPERS
@@ -153,12 +325,13 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
 # PERFORMANCE OPTIMIZATION
 # ============================================================================
 
-_performance_cache = {}
-
+@st.cache_data(show_spinner=False, ttl=30)
 def optimize_performance():
-    """Cache expensive calculations for better performance."""
-    # This is a placeholder for performance optimization
-    # In a real implementation, you'd cache financial summaries, etc.
+    """Cache expensive calculations for better performance.
+
+    Cleared eagerly by save_data; the TTL only bounds staleness when the
+    data file is edited outside the app.
+    """
     return get_financial_summary(load_data()["finances"])
 
 # ============================================================================